@@ -1,13 +1,12 @@
 import numpy
-from matplotlib import pyplot
-from scipy.optimize import OptimizeWarning
-from scipy.optimize import curve_fit
 from .Spikes import Spikes
 
 
 class Spectrum:
     """An example docstring for a class."""
 
+    __slots__ = ("_peaks", "_losses", "_metadata")
+
     def __init__(self, mz: numpy.array, intensities: numpy.array, metadata=None):
         """An example docstring for a constructor."""
         self.peaks = Spikes(mz=mz, intensities=intensities)
@@ -24,15 +23,21 @@ class Spectrum:
             self.metadata == other.metadata
 
     def clone(self):
-        """Return a deepcopy of the spectrum instance."""
-        clone = Spectrum(mz=self.peaks.mz,
-                         intensities=self.peaks.intensities,
+        """Return a copy of the spectrum instance.
+
+        Metadata is copied. Peak and loss arrays are read-only and are shared with the clone."""
+        clone = Spectrum(mz=self._peaks.mz,
+                         intensities=self._peaks.intensities,
                          metadata=self.metadata)
         clone.losses = self.losses
         return clone
 
     def plot(self, intensity_from=0.0, intensity_to=None, with_histogram=False, with_expfit=False):
         """An example docstring for a method."""
+        # pylint: disable=import-outside-toplevel
+        from matplotlib import pyplot
+        from scipy.optimize import OptimizeWarning
+        from scipy.optimize import curve_fit
 
         def plot_histogram():
             """plot the histogram of intensity values as horizontal bars, aligned with the spectrum axes"""
@@ -144,8 +149,8 @@ class Spectrum:
 
     @property
     def losses(self):
-        """getter method for _losses private variable"""
-        return self._losses.clone() if self._losses is not None else None
+        """getter method for _losses private variable (Spikes are read-only, so no copy is made)"""
+        return self._losses
 
     @losses.setter
     def losses(self, value):
@@ -154,8 +159,8 @@ class Spectrum:
 
     @property
     def peaks(self):
-        """getter method for _peaks private variable"""
-        return self._peaks.clone()
+        """getter method for _peaks private variable (Spikes are read-only, so no copy is made)"""
+        return self._peaks
 
     @peaks.setter
     def peaks(self, value):
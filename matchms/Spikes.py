@@ -4,7 +4,12 @@ import numpy
 class Spikes:
     """
     Stores arrays of intensities and M/z values, with some checks on their internal consistency.
+
+    Writeable input arrays are copied once; read-only input arrays are taken over without copying.
     """
+
+    __slots__ = ("_mz", "_intensities")
+
     def __init__(self, mz=None, intensities=None):
         assert isinstance(mz, numpy.ndarray), "Input argument 'mz' should be a numpy.array."
         assert isinstance(intensities, numpy.ndarray), "Input argument 'intensities' should be a numpy.array."
@@ -12,8 +17,8 @@ class Spikes:
         assert mz.dtype == "float", "Input argument 'mz' should be an array of type float."
         assert intensities.dtype == "float", "Input argument 'intensities' should be an array of type float."
 
-        self._mz = mz
-        self._intensities = intensities
+        self._mz = _as_owned_read_only(mz)
+        self._intensities = _as_owned_read_only(intensities)
 
         assert self._is_sorted(), "mz values are out of order."
 
@@ -24,6 +29,15 @@ class Spikes:
             self.intensities.shape == other.intensities.shape and \
             numpy.allclose(self.intensities, other.intensities)
 
+    def __getstate__(self):
+        return self._mz, self._intensities
+
+    def __setstate__(self, state):
+        # Unpickling (also used by copy.deepcopy) skips __init__ and restores writeable arrays
+        mz, intensities = state
+        self._mz = _as_owned_read_only(mz)
+        self._intensities = _as_owned_read_only(intensities)
+
     def __len__(self):
         return self._mz.size
 
@@ -38,10 +52,26 @@ class Spikes:
 
     @property
     def mz(self):
-        """getter method for mz private variable"""
-        return self._mz.copy()
+        """getter method for mz private variable (read-only, copy before modifying)"""
+        return self._mz
 
     @property
     def intensities(self):
-        """getter method for intensities private variable"""
-        return self._intensities.copy()
+        """getter method for intensities private variable (read-only, copy before modifying)"""
+        return self._intensities
+
+
+def _as_owned_read_only(array):
+    """Return array as read-only data.
+
+    Writeable input (or a view of writeable data) is copied once, so later changes to the caller's
+    array do not leak in. Data that is already read-only, e.g. from another Spikes, is shared as is;
+    callers passing read-only arrays must not make them writeable again."""
+    base = array
+    while isinstance(base, numpy.ndarray):
+        if base.flags.writeable:
+            owned = array.copy()
+            owned.flags.writeable = False
+            return owned
+        base = base.base
+    return array
@@ -1,6 +1,3 @@
-import pyteomics.mgf as py_mgf
-
-
 def save_as_mgf(spectrums, filename: str):
     """Save spectrum(s) as mgf file.
 
@@ -9,16 +6,22 @@ def save_as_mgf(spectrums, filename: str):
     spectrums: list of Spectrum() objects, Spectrum() object
         Expected input are match.Spectrum.Spectrum() objects.
     filename: str
-        Provide filename to save spectrum(s).
+        Provide filename to save spectrum(s). If the file already exists, spectrum(s)
+        are appended to it.
     """
+    # pylint: disable=import-outside-toplevel
+    import pyteomics.mgf as py_mgf
+
     if not isinstance(spectrums, list):
         # Assume that input was single Spectrum
         spectrums = [spectrums]
 
-    # Convert matchms.Spectrum() into dictionaries for pyteomics
-    for spectrum in spectrums:
-        spectrum_dict = {"m/z array": spectrum.peaks.mz,
-                         "intensity array": spectrum.peaks.intensities,
-                         "params": spectrum.metadata}
-        # Append spectrum to file
-        py_mgf.write([spectrum_dict], filename)
+    def to_pyteomics_dicts():
+        """Convert matchms.Spectrum() into dictionaries for pyteomics, one at a time."""
+        for spectrum in spectrums:
+            yield {"m/z array": spectrum.peaks.mz,
+                   "intensity array": spectrum.peaks.intensities,
+                   "params": spectrum.metadata}
+
+    # Append all spectrums to file in a single pass (pyteomics' default file mode differs between versions)
+    py_mgf.write(to_pyteomics_dicts(), filename, file_mode="a")
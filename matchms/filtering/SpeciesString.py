@@ -1,4 +1,10 @@
 import re
+from ..utils import INCHI_LOOKALIKE
+from ..utils import INCHIKEY_FORMAT
+from ..utils import SMILES_LOOKALIKE
+
+
+_INCHI_CLEAN = re.compile(r"(1S\/|1\/)[0-9, A-Z, a-z,\.]{2,}\/(c|h)[0-9].*$")
 
 
 class SpeciesString:
@@ -33,8 +39,7 @@ class SpeciesString:
 
     def clean_as_inchi(self):
         """Search for valid inchi and harmonize it."""
-        regexp = r"(1S\/|1\/)[0-9, A-Z, a-z,\.]{2,}\/(c|h)[0-9].*$"
-        found = re.search(regexp, self.dirty)
+        found = _INCHI_CLEAN.search(self.dirty)
         if found is None:
             self.cleaned = ""
         else:
@@ -42,8 +47,7 @@ class SpeciesString:
 
     def clean_as_inchikey(self):
         """Search for valid inchikey and harmonize it."""
-        regexp = r"[A-Z]{14}-[A-Z]{10}-[A-Z]"
-        found = re.search(regexp, self.dirty)
+        found = INCHIKEY_FORMAT.search(self.dirty)
         if found is None:
             self.cleaned = ""
         else:
@@ -51,8 +55,7 @@ class SpeciesString:
 
     def clean_as_smiles(self):
         """Search for valid smiles and harmonize it."""
-        regexp = r"^([^J][0-9BCOHNSOPIFKcons@+\-\[\]\(\)\\\/%=#$,.~&!|Si|Se|Br|Mg|Na|Cl|Al]{3,})$"
-        found = re.search(regexp, self.dirty)
+        found = SMILES_LOOKALIKE.search(self.dirty)
         if found is None:
             self.cleaned = ""
         else:
@@ -73,15 +76,12 @@ class SpeciesString:
 
     def looks_like_an_inchi(self):
         """Search for first piece of InChI."""
-        regexp = r"(InChI=1|1)(S\/|\/)[0-9, A-Z, a-z,\.]{2,}\/(c|h)[0-9]"
-        return re.search(regexp, self.dirty) is not None
+        return INCHI_LOOKALIKE.search(self.dirty) is not None
 
     def looks_like_an_inchikey(self):
         """Return True if string has format of inchikey."""
-        regexp = r"[A-Z]{14}-[A-Z]{10}-[A-Z]"
-        return re.search(regexp, self.dirty) is not None
+        return INCHIKEY_FORMAT.search(self.dirty) is not None
 
     def looks_like_a_smiles(self):
         """Return True if string is made of allowed charcters for smiles."""
-        regexp = r"^([^J][0-9BCOHNSOPIFKcons@+\-\[\]\(\)\\\/%=#$,.~&!|Si|Se|Br|Mg|Na|Cl|Al]{3,})$"
-        return re.search(regexp, self.dirty) is not None
+        return SMILES_LOOKALIKE.search(self.dirty) is not None
@@ -1,6 +1,9 @@
 from ..typing import SpectrumType
 
 
+_ADDUCT_STRIP = str.maketrans("", "", "\n []*")
+
+
 def add_adduct(spectrum_in: SpectrumType) -> SpectrumType:
     """Add adduct to metadata (if not present yet).
 
@@ -12,12 +15,8 @@ def add_adduct(spectrum_in: SpectrumType) -> SpectrumType:
     if spectrum.get("adduct", None) is None:
         try:
             name = spectrum.get("name")
-            adduct = name.split(' ')[-1]
-            adduct = adduct.replace('\n', '') \
-                           .replace(' ', '')  \
-                           .replace('[', '')  \
-                           .replace(']', '')  \
-                           .replace('*', '')
+            adduct = name.rpartition(' ')[2]
+            adduct = adduct.translate(_ADDUCT_STRIP)
             if adduct:
                 spectrum.set("adduct", adduct)
         except KeyError:
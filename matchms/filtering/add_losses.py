@@ -19,7 +19,8 @@ def add_losses(spectrum_in):
     if precursor_mz is not None:
         assert precursor_mz_is_number(), "Expected 'precursor_mz' to be a scalar number."
         peaks_mz, peaks_intensities = spectrum.peaks
-        losses_mz = (precursor_mz - peaks_mz)[::-1]
+        losses_mz = precursor_mz - peaks_mz[::-1]
+        losses_mz.setflags(write=False)
         losses_intensities = peaks_intensities
         spectrum.losses = Spikes(mz=losses_mz, intensities=losses_intensities)
 
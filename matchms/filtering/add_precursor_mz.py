@@ -12,9 +12,10 @@ def add_precursor_mz(spectrum_in: SpectrumType) -> SpectrumType:
 
     spectrum = spectrum_in.clone()
 
-    if isinstance(spectrum.get("precursor_mz", None), str):
-        spectrum.set("precursor_mz", float(spectrum.get("precursor_mz").strip()))
-    elif spectrum.get("precursor_mz", None) is None:
+    precursor_mz = spectrum.get("precursor_mz", None)
+    if isinstance(precursor_mz, str):
+        spectrum.set("precursor_mz", float(precursor_mz.strip()))
+    elif precursor_mz is None:
         pepmass = spectrum.get("pepmass")
         if isinstance(pepmass[0], float):
             spectrum.set("precursor_mz", pepmass[0])
@@ -1,7 +1,9 @@
-import numpy
 from ..typing import SpectrumType
 
 
+_IONMODE_SIGNS = {"positive": 1, "negative": -1}
+
+
 def correct_charge(spectrum_in: SpectrumType) -> SpectrumType:
     """
     For some spectrums, the charge value is either undefined or inconsistent with its
@@ -19,17 +21,13 @@ def correct_charge(spectrum_in: SpectrumType) -> SpectrumType:
 
     if charge is None:
         charge = 0
-    elif charge == 0 and ionmode == 'positive':
-        charge = 1
-    elif charge == 0 and ionmode == 'negative':
-        charge = -1
-    else:
-        pass
+    elif charge == 0:
+        charge = _IONMODE_SIGNS.get(ionmode, 0)
 
     # Correct charge when in conflict with ionmode (trust ionmode more!)
-    if numpy.sign(charge) == 1 and ionmode == 'negative':
+    if charge > 0 and ionmode == 'negative':
         charge *= -1
-    elif numpy.sign(charge) == -1 and ionmode == 'positive':
+    elif charge < 0 and ionmode == 'positive':
         charge *= -1
 
     spectrum.set("charge", charge)
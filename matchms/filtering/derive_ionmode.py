@@ -20,15 +20,14 @@ def derive_ionmode(spectrum_in: SpectrumType, adducts_filename=None) -> Spectrum
 
     spectrum = spectrum_in.clone()
 
-    # Load lists of known adducts
-    known_adducts = load_adducts(filename=adducts_filename)
-
     adduct = spectrum.get("adduct", None)
 
     ionmode = spectrum.get("ionmode")
 
     # Try completing missing or incorrect ionmodes
     if ionmode not in ["positive", "negative"]:
+        # Load lists of known adducts (only needed when ionmode has to be derived)
+        known_adducts = load_adducts(filename=adducts_filename)
         if adduct in known_adducts["adducts_positive"]:
             ionmode = "positive"
             print("Added ionmode '" + ionmode + "' based on adduct: ", adduct)
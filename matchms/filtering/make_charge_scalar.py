@@ -9,7 +9,8 @@ def make_charge_scalar(spectrum_in: SpectrumType) -> SpectrumType:
     spectrum = spectrum_in.clone()
 
     # Avoid pyteomics ChargeList
-    if isinstance(spectrum.get("charge", None), list):
-        spectrum.set("charge", int(spectrum.get("charge")[0]))
+    charge = spectrum.get("charge", None)
+    if isinstance(charge, list):
+        spectrum.set("charge", int(charge[0]))
 
     return spectrum
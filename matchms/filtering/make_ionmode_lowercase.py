@@ -9,7 +9,8 @@ def make_ionmode_lowercase(spectrum_in: SpectrumType) -> SpectrumType:
     spectrum = spectrum_in.clone()
 
     # if the ionmode key exists in the metadata, lowercase its value
-    if spectrum.get("ionmode") is not None:
-        spectrum.set("ionmode", spectrum.get("ionmode").lower())
+    ionmode = spectrum.get("ionmode")
+    if ionmode is not None:
+        spectrum.set("ionmode", ionmode.lower())
 
     return spectrum
@@ -15,6 +15,7 @@ def normalize_intensities(spectrum_in: SpectrumType) -> SpectrumType:
         scale_factor = numpy.max(spectrum.peaks.intensities)
         mz, intensities = spectrum.peaks
         normalized_intensities = intensities / scale_factor
+        normalized_intensities.setflags(write=False)
         spectrum.peaks = Spikes(mz=mz, intensities=normalized_intensities)
 
     return spectrum
@@ -15,7 +15,8 @@ def repair_inchi_inchikey_smiles(spectrum_in: SpectrumType):
     inchikey = spectrum.get("inchikey", "")
     smiles = spectrum.get("smiles", "")
 
-    cleaneds = [SpeciesString(s) for s in [inchi, inchiaux, inchikey, smiles]]
+    # empty fields cannot contain anything to repair, so skip those
+    cleaneds = [SpeciesString(s) for s in [inchi, inchiaux, inchikey, smiles] if s]
 
     # for each type, list what we have and pick one
     inchis = [c.cleaned for c in cleaneds if c.target == "inchi" and c.cleaned != ""]
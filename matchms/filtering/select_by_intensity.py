@@ -12,10 +12,13 @@ def select_by_intensity(spectrum_in: SpectrumType, intensity_from=10.0, intensit
 
     assert intensity_from <= intensity_to, "'intensity_from' should be smaller than or equal to 'intensity_to'."
 
-    condition = numpy.logical_and(intensity_from <= spectrum.peaks.intensities,
-                                  spectrum.peaks.intensities <= intensity_to)
-
-    spectrum.peaks = Spikes(mz=spectrum.peaks.mz[condition],
-                            intensities=spectrum.peaks.intensities[condition])
+    mz, intensities = spectrum.peaks
+    condition = numpy.logical_and(intensity_from <= intensities, intensities <= intensity_to)
+
+    mz_selected = mz[condition]
+    mz_selected.setflags(write=False)
+    intensities_selected = intensities[condition]
+    intensities_selected.setflags(write=False)
+    spectrum.peaks = Spikes(mz=mz_selected, intensities=intensities_selected)
 
     return spectrum
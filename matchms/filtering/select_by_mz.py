@@ -12,9 +12,12 @@ def select_by_mz(spectrum_in: SpectrumType, mz_from=0.0, mz_to=1000.0) -> Spectr
 
     assert mz_from <= mz_to, "'mz_from' should be smaller than or equal to 'mz_to'."
 
-    condition = numpy.logical_and(mz_from <= spectrum.peaks.mz, spectrum.peaks.mz <= mz_to)
+    # Spikes guarantees that mz is sorted, so the selection is a contiguous slice
+    mz, intensities = spectrum.peaks
+    i_from = numpy.searchsorted(mz, mz_from, side="left")
+    i_to = numpy.searchsorted(mz, mz_to, side="right")
 
-    spectrum.peaks = Spikes(mz=spectrum.peaks.mz[condition],
-                            intensities=spectrum.peaks.intensities[condition])
+    spectrum.peaks = Spikes(mz=mz[i_from:i_to],
+                            intensities=intensities[i_from:i_to])
 
     return spectrum
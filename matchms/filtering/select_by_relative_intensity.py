@@ -15,10 +15,14 @@ def select_by_relative_intensity(spectrum_in: SpectrumType, intensity_from=0.0,
     assert intensity_from <= intensity_to, "'intensity_from' should be smaller than or equal to 'intensity_to'."
 
     if len(spectrum.peaks) > 0:
-        scale_factor = numpy.max(spectrum.peaks.intensities)
-        normalized_intensities = spectrum.peaks.intensities / scale_factor
+        mz, intensities = spectrum.peaks
+        scale_factor = numpy.max(intensities)
+        normalized_intensities = intensities / scale_factor
         condition = numpy.logical_and(intensity_from <= normalized_intensities, normalized_intensities <= intensity_to)
-        spectrum.peaks = Spikes(mz=spectrum.peaks.mz[condition],
-                                intensities=spectrum.peaks.intensities[condition])
+        mz_selected = mz[condition]
+        mz_selected.setflags(write=False)
+        intensities_selected = intensities[condition]
+        intensities_selected.setflags(write=False)
+        spectrum.peaks = Spikes(mz=mz_selected, intensities=intensities_selected)
 
     return spectrum
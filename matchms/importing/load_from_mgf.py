@@ -1,11 +1,12 @@
 from typing import Generator
 import numpy
-from pyteomics.mgf import MGF
 from ..Spectrum import Spectrum
 
 
 def load_from_mgf(filename: str) -> Generator[Spectrum, None, None]:
     """Load spectrum(s) from mgf file."""
+    # pylint: disable=import-outside-toplevel
+    from pyteomics.mgf import MGF
 
     for pyteomics_spectrum in MGF(filename, convert_arrays=1):
 
@@ -15,8 +16,11 @@ def load_from_mgf(filename: str) -> Generator[Spectrum, None, None]:
 
         # Sort by mz (if not sorted already)
         if not numpy.all(mz[:-1] <= mz[1:]):
-            idx_sorted = numpy.argsort(mz)
+            idx_sorted = numpy.argsort(mz, kind="stable")
             mz = mz[idx_sorted]
             intensities = intensities[idx_sorted]
 
+        # Arrays are not used elsewhere, so Spectrum can take them over without copying
+        mz.setflags(write=False)
+        intensities.setflags(write=False)
         yield Spectrum(mz=mz, intensities=intensities, metadata=metadata)
@@ -9,22 +9,17 @@ class CosineGreedy:
 
     def __call__(self, spectrum: SpectrumType, reference_spectrum: SpectrumType) -> float:
         def calc_mz_distance():
-            mz_row_vector = spectrum.peaks.mz
-            mz_col_vector = numpy.reshape(reference_spectrum.peaks.mz, (n_rows, 1))
+            mz_row_vector = numpy.reshape(spec_mz, (1, n_cols))
+            mz_col_vector = numpy.reshape(ref_mz, (n_rows, 1))
 
-            mz1 = numpy.tile(mz_row_vector, (n_rows, 1))
-            mz2 = numpy.tile(mz_col_vector, (1, n_cols))
-
-            return mz1 - mz2
+            # broadcasting allocates only the (n_rows, n_cols) result, not tiled copies of the inputs
+            return mz_row_vector - mz_col_vector
 
         def calc_intensities_product():
-            intensities_row_vector = spectrum.peaks.intensities
-            intensities_col_vector = numpy.reshape(reference_spectrum.peaks.intensities, (n_rows, 1))
-
-            intensities1 = numpy.tile(intensities_row_vector, (n_rows, 1))
-            intensities2 = numpy.tile(intensities_col_vector, (1, n_cols))
+            intensities_row_vector = numpy.reshape(spec_intensities, (1, n_cols))
+            intensities_col_vector = numpy.reshape(ref_intensities, (n_rows, 1))
 
-            return intensities1 * intensities2
+            return intensities_row_vector * intensities_col_vector
 
         def calc_intensities_product_within_tolerance():
 
@@ -33,7 +28,8 @@ class CosineGreedy:
 
             within_tolerance = numpy.absolute(mz_distance) <= self.tolerance
 
-            return numpy.where(within_tolerance, intensities_product, numpy.zeros_like(intensities_product))
+            intensities_product[~within_tolerance] = 0
+            return intensities_product
 
         def calc_score():
             r_unordered, c_unordered = intensities_product_within_tolerance.nonzero()
@@ -50,14 +46,21 @@ class CosineGreedy:
                     n_matches += 1
                     intensities_product_within_tolerance[r, :] = 0
                     intensities_product_within_tolerance[:, c] = 0
-            return score / max(sum(squared1), sum(squared2)), n_matches
+            norm = max(numpy.sum(squared1), numpy.sum(squared2))
+            if norm == 0:
+                # both spectrums have no (non-zero) peaks, so there is nothing to match
+                return 0.0, n_matches
+            return score / norm, n_matches
+
+        spec_mz, spec_intensities = spectrum.peaks
+        ref_mz, ref_intensities = reference_spectrum.peaks
 
-        n_rows = reference_spectrum.peaks.mz.size
-        n_cols = spectrum.peaks.mz.size
+        n_rows = ref_mz.size
+        n_cols = spec_mz.size
 
         intensities_product_within_tolerance = calc_intensities_product_within_tolerance()
 
-        squared1 = numpy.power(spectrum.peaks.intensities, 2)
-        squared2 = numpy.power(reference_spectrum.peaks.intensities, 2)
+        squared1 = numpy.power(spec_intensities, 2)
+        squared2 = numpy.power(ref_intensities, 2)
 
         return calc_score()
@@ -11,10 +11,10 @@ class IntersectMz:
         """call method"""
         mz = set(spectrum.peaks.mz)
         mz_ref = set(reference_spectrum.peaks.mz)
-        intersected = mz.intersection(mz_ref)
-        unioned = mz.union(mz_ref)
+        n_intersected = len(mz.intersection(mz_ref))
+        n_unioned = len(mz) + len(mz_ref) - n_intersected
 
-        if len(unioned) == 0:
+        if n_unioned == 0:
             return 0
 
-        return len(intersected) / len(unioned)
+        return n_intersected / n_unioned
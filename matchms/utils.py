@@ -1,5 +1,23 @@
 import re
-from rdkit import Chem
+from functools import lru_cache
+
+
+INCHI_LOOKALIKE = re.compile(r"(InChI=1|1)(S\/|\/)[0-9, A-Z, a-z,\.]{2,}\/(c|h)[0-9]")
+SMILES_LOOKALIKE = re.compile(r"^([^J][0-9BCOHNSOPIFKcons@+\-\[\]\(\)\\\/%=#$,.~&!|Si|Se|Br|Mg|Na|Cl|Al]{3,})$")
+INCHIKEY_FORMAT = re.compile(r"[A-Z]{14}-[A-Z]{10}-[A-Z]")
+
+
+@lru_cache(maxsize=1)
+def _mol_functions():
+    """Return lookup tables of rdkit input and output functions, built once on first use."""
+    # pylint: disable=import-outside-toplevel
+    from rdkit import Chem
+    input_functions = {"inchi": Chem.MolFromInchi,
+                       "smiles": Chem.MolFromSmiles}
+    output_functions = {"inchi": Chem.MolToInchi,
+                        "smiles": Chem.MolToSmiles,
+                        "inchikey": Chem.MolToInchiKey}
+    return input_functions, output_functions
 
 
 def convert_smiles_to_inchi(smiles):
@@ -14,6 +32,7 @@ def convert_inchi_to_inchikey(inchi):
     return mol_converter(inchi, "inchi", "inchikey")
 
 
+@lru_cache(maxsize=10000)
 def mol_converter(mol_input, input_type, output_type):
     """Convert molecular representations using rdkit.
 
@@ -28,22 +47,21 @@ def mol_converter(mol_input, input_type, output_type):
     output_type: str
         Define output type: "smiles", "inchi", or "inchikey".
     """
-    input_function = {"inchi": Chem.MolFromInchi,
-                      "smiles": Chem.MolFromSmiles}
-    output_function = {"inchi": Chem.MolToInchi,
-                       "smiles": Chem.MolToSmiles,
-                       "inchikey": Chem.MolToInchiKey}
+    input_functions, output_functions = _mol_functions()
+    input_function = input_functions[input_type]
+    output_function = output_functions[output_type]
 
-    mol = input_function[input_type](mol_input.strip('"'))
+    mol = input_function(mol_input.strip('"'))
     if mol is None:
         return None
 
-    output = output_function[output_type](mol)
+    output = output_function(mol)
     if output:
         return output
     return None
 
 
+@lru_cache(maxsize=10000)
 def is_valid_inchi(inchi):
     """Return True if input string is valid InChI.
 
@@ -58,16 +76,18 @@ def is_valid_inchi(inchi):
     if inchi is None:
         return False
     inchi = inchi.strip('"')
-    regexp = r"(InChI=1|1)(S\/|\/)[0-9, A-Z, a-z,\.]{2,}\/(c|h)[0-9]"
-    if not re.search(regexp, inchi):
+    if not INCHI_LOOKALIKE.search(inchi):
         return False
     # Proper chemical test
+    # pylint: disable=import-outside-toplevel
+    from rdkit import Chem
     mol = Chem.MolFromInchi(inchi)
     if mol:
         return True
     return False
 
 
+@lru_cache(maxsize=10000)
 def is_valid_smiles(smiles):
     """Return True if input string is valid smiles.
 
@@ -81,10 +101,11 @@ def is_valid_smiles(smiles):
     if smiles is None:
         return False
 
-    regexp = r"^([^J][0-9BCOHNSOPIFKcons@+\-\[\]\(\)\\\/%=#$,.~&!|Si|Se|Br|Mg|Na|Cl|Al]{3,})$"
-    if not re.match(regexp, smiles):
+    if not SMILES_LOOKALIKE.match(smiles):
         return False
 
+    # pylint: disable=import-outside-toplevel
+    from rdkit import Chem
     mol = Chem.MolFromSmiles(smiles)
     if mol:
         return True
@@ -96,7 +117,6 @@ def is_valid_inchikey(inchikey):
     if inchikey is None:
         return False
 
-    regexp = r"[A-Z]{14}-[A-Z]{10}-[A-Z]"
-    if re.fullmatch(regexp, inchikey):
+    if INCHIKEY_FORMAT.fullmatch(inchikey):
         return True
     return False
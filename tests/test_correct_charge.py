@@ -0,0 +1,114 @@
+import numpy
+from matchms import Spectrum
+from matchms.filtering import correct_charge
+
+
+def test_correct_charge_missing_charge_set_to_zero():
+    mz = numpy.array([], dtype='float')
+    intensities = numpy.array([], dtype='float')
+    metadata = {"ionmode": "positive"}
+    spectrum_in = Spectrum(mz=mz,
+                           intensities=intensities,
+                           metadata=metadata)
+
+    spectrum = correct_charge(spectrum_in)
+
+    assert spectrum.get("charge") == 0, "Expected charge 0 when charge is missing."
+
+
+def test_correct_charge_zero_charge_positive_ionmode():
+    mz = numpy.array([], dtype='float')
+    intensities = numpy.array([], dtype='float')
+    metadata = {"charge": 0,
+                "ionmode": "positive"}
+    spectrum_in = Spectrum(mz=mz,
+                           intensities=intensities,
+                           metadata=metadata)
+
+    spectrum = correct_charge(spectrum_in)
+
+    assert spectrum.get("charge") == 1, "Expected charge 1 for positive ionmode."
+
+
+def test_correct_charge_zero_charge_negative_ionmode():
+    mz = numpy.array([], dtype='float')
+    intensities = numpy.array([], dtype='float')
+    metadata = {"charge": 0,
+                "ionmode": "negative"}
+    spectrum_in = Spectrum(mz=mz,
+                           intensities=intensities,
+                           metadata=metadata)
+
+    spectrum = correct_charge(spectrum_in)
+
+    assert spectrum.get("charge") == -1, "Expected charge -1 for negative ionmode."
+
+
+def test_correct_charge_zero_charge_unknown_ionmode():
+    mz = numpy.array([], dtype='float')
+    intensities = numpy.array([], dtype='float')
+    metadata = {"charge": 0,
+                "ionmode": "n/a"}
+    spectrum_in = Spectrum(mz=mz,
+                           intensities=intensities,
+                           metadata=metadata)
+
+    spectrum = correct_charge(spectrum_in)
+
+    assert spectrum.get("charge") == 0, "Expected charge 0 when ionmode is unknown."
+
+
+def test_correct_charge_positive_charge_positive_ionmode():
+    mz = numpy.array([], dtype='float')
+    intensities = numpy.array([], dtype='float')
+    metadata = {"charge": 2,
+                "ionmode": "positive"}
+    spectrum_in = Spectrum(mz=mz,
+                           intensities=intensities,
+                           metadata=metadata)
+
+    spectrum = correct_charge(spectrum_in)
+
+    assert spectrum.get("charge") == 2, "Expected charge to remain unchanged."
+
+
+def test_correct_charge_positive_charge_negative_ionmode():
+    mz = numpy.array([], dtype='float')
+    intensities = numpy.array([], dtype='float')
+    metadata = {"charge": 2,
+                "ionmode": "negative"}
+    spectrum_in = Spectrum(mz=mz,
+                           intensities=intensities,
+                           metadata=metadata)
+
+    spectrum = correct_charge(spectrum_in)
+
+    assert spectrum.get("charge") == -2, "Expected charge sign to follow ionmode."
+
+
+def test_correct_charge_negative_charge_positive_ionmode():
+    mz = numpy.array([], dtype='float')
+    intensities = numpy.array([], dtype='float')
+    metadata = {"charge": -1,
+                "ionmode": "positive"}
+    spectrum_in = Spectrum(mz=mz,
+                           intensities=intensities,
+                           metadata=metadata)
+
+    spectrum = correct_charge(spectrum_in)
+
+    assert spectrum.get("charge") == 1, "Expected charge sign to follow ionmode."
+
+
+def test_correct_charge_negative_charge_unknown_ionmode():
+    mz = numpy.array([], dtype='float')
+    intensities = numpy.array([], dtype='float')
+    metadata = {"charge": -1,
+                "ionmode": "n/a"}
+    spectrum_in = Spectrum(mz=mz,
+                           intensities=intensities,
+                           metadata=metadata)
+
+    spectrum = correct_charge(spectrum_in)
+
+    assert spectrum.get("charge") == -1, "Expected charge to remain unchanged."
@@ -78,3 +78,33 @@ def test_cosine_score_greedy_order_of_arguments():
 
     assert score_1_2 == score_2_1, "Expected that the order of the arguments would not matter."
     assert n_matches_1_2 == n_matches_2_1, "Expected that the order of the arguments would not matter."
+
+
+def test_cosine_greedy_empty_spectrums():
+
+    spectrum_1 = Spectrum(mz=numpy.array([], dtype="float"),
+                          intensities=numpy.array([], dtype="float"))
+
+    spectrum_2 = Spectrum(mz=numpy.array([], dtype="float"),
+                          intensities=numpy.array([], dtype="float"))
+
+    cosine_greedy = CosineGreedy()
+    score, n_matches = cosine_greedy(spectrum_1, spectrum_2)
+
+    assert score == 0.0, "Expected score of 0.0 for spectrums without peaks."
+    assert n_matches == 0
+
+
+def test_cosine_greedy_zero_intensity_spectrums():
+
+    spectrum_1 = Spectrum(mz=numpy.array([100, 200, 300], dtype="float"),
+                          intensities=numpy.array([0, 0, 0], dtype="float"))
+
+    spectrum_2 = Spectrum(mz=numpy.array([100, 200, 310], dtype="float"),
+                          intensities=numpy.array([0, 0, 0], dtype="float"))
+
+    cosine_greedy = CosineGreedy()
+    score, n_matches = cosine_greedy(spectrum_1, spectrum_2)
+
+    assert score == 0.0, "Expected score of 0.0 for spectrums with only zero intensities."
+    assert n_matches == 0
@@ -53,3 +53,25 @@ def test_save_as_mgf_spectrum_list():
         assert mgf_content[5] == mgf_content[12] == "END IONS\n"
         assert mgf_content[1].split("=")[1] == "test1\n"
         assert mgf_content[8].split("=")[1] == "test2\n"
+
+
+def test_save_as_mgf_appends_to_existing_file():
+    """Test that saving to an existing .mgf file appends the spectrum(s)"""
+    spectrum1 = Spectrum(mz=numpy.array([100, 200, 300], dtype="float"),
+                         intensities=numpy.array([10, 10, 500], dtype="float"),
+                         metadata={"test_field": "test1"})
+
+    spectrum2 = Spectrum(mz=numpy.array([100, 200, 300], dtype="float"),
+                         intensities=numpy.array([10, 10, 500], dtype="float"),
+                         metadata={"test_field": "test2"})
+    # Write to test file twice
+    with tempfile.TemporaryDirectory() as d:
+        filename = os.path.join(d, "test.mgf")
+        save_as_mgf([spectrum1, spectrum2], filename)
+        save_as_mgf(spectrum1, filename)
+
+        # Test if all three spectrums are in the mgf file
+        with open(filename, "r") as f:
+            mgf_content = f.readlines()
+        assert mgf_content.count("BEGIN IONS\n") == 3
+        assert mgf_content[15].split("=")[1] == "test1\n"
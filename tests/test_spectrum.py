@@ -1,6 +1,7 @@
 import numpy
 from matplotlib import pyplot as plt
 from matchms import Spectrum
+from matchms.filtering import select_by_mz
 
 
 def _assert_plots_ok(fig, n_plots):
@@ -61,3 +62,32 @@ def test_spectrum_plot_with_histogram_unspecified():
     spectrum = _create_test_spectrum()
     fig = spectrum.plot()
     _assert_plots_ok(fig, n_plots=1)
+
+
+def test_spectrum_clone_unaffected_by_changing_input_arrays():
+    mz = numpy.array([10, 20, 30], dtype="float")
+    intensities = numpy.array([1, 5, 9], dtype="float")
+    spectrum = Spectrum(mz=mz, intensities=intensities)
+
+    spectrum_cloned = spectrum.clone()
+    mz[0] = 999.0
+    intensities[0] = 0.0
+
+    expected_mz = numpy.array([10, 20, 30], dtype="float")
+    expected_intensities = numpy.array([1, 5, 9], dtype="float")
+    assert numpy.array_equal(spectrum.peaks.mz, expected_mz)
+    assert numpy.array_equal(spectrum.peaks.intensities, expected_intensities)
+    assert numpy.array_equal(spectrum_cloned.peaks.mz, expected_mz)
+    assert numpy.array_equal(spectrum_cloned.peaks.intensities, expected_intensities)
+
+
+def test_spectrum_filtered_unaffected_by_changing_input_arrays():
+    mz = numpy.array([10, 20, 30], dtype="float")
+    intensities = numpy.array([1, 5, 9], dtype="float")
+    spectrum = Spectrum(mz=mz, intensities=intensities)
+
+    spectrum_filtered = select_by_mz(spectrum, mz_from=0.0, mz_to=25.0)
+    mz[0] = 999.0
+
+    assert numpy.array_equal(spectrum_filtered.peaks.mz, numpy.array([10, 20], dtype="float"))
+    assert numpy.array_equal(spectrum.peaks.mz, numpy.array([10, 20, 30], dtype="float"))
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import numpy
 import pytest
 from matchms import Spikes
@@ -94,3 +96,57 @@ def test_spikes_unpack():
 
     assert numpy.allclose(mz, mz_unpacked)
     assert numpy.allclose(intensities, intensities_unpacked)
+
+
+def test_spikes_arrays_are_read_only():
+
+    mz = numpy.array([10, 20, 30], dtype="float")
+    intensities = numpy.array([100, 20, 300], dtype="float")
+
+    peaks = Spikes(mz=mz, intensities=intensities)
+
+    with pytest.raises(ValueError):
+        peaks.mz[0] = 5.0
+
+    with pytest.raises(ValueError):
+        peaks.intensities[0] = 5.0
+
+
+def test_spikes_unaffected_by_changing_input_arrays():
+
+    mz = numpy.array([10, 20, 30], dtype="float")
+    intensities = numpy.array([100, 20, 300], dtype="float")
+
+    peaks = Spikes(mz=mz, intensities=intensities)
+
+    mz[0] = 999.0
+    intensities[0] = 0.0
+
+    assert numpy.array_equal(peaks.mz, numpy.array([10, 20, 30], dtype="float"))
+    assert numpy.array_equal(peaks.intensities, numpy.array([100, 20, 300], dtype="float"))
+
+
+def test_spikes_dot_clone_shares_arrays():
+
+    mz = numpy.array([10, 20, 30], dtype="float")
+    intensities = numpy.array([100, 20, 300], dtype="float")
+
+    peaks = Spikes(mz=mz, intensities=intensities)
+
+    peaks_cloned = peaks.clone()
+
+    assert numpy.shares_memory(peaks.mz, peaks_cloned.mz)
+    assert numpy.shares_memory(peaks.intensities, peaks_cloned.intensities)
+
+
+def test_spikes_arrays_read_only_after_deepcopy_and_pickle():
+
+    mz = numpy.array([10, 20, 30], dtype="float")
+    intensities = numpy.array([100, 20, 300], dtype="float")
+
+    peaks = Spikes(mz=mz, intensities=intensities)
+
+    for peaks_copied in [copy.deepcopy(peaks), pickle.loads(pickle.dumps(peaks))]:
+        assert peaks_copied == peaks
+        assert not peaks_copied.mz.flags.writeable, "Expected mz array to be read-only."
+        assert not peaks_copied.intensities.flags.writeable, "Expected intensities array to be read-only."